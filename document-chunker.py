@@ -45,16 +45,18 @@ Directory Handling:
 
   Output:
     └── output_folder/
-        ├── docs_guide_chunk_1.txt
-        ├── docs_specs_technical_chunk_1.txt
-        ├── blog_posts_post1_chunk_1.txt
-        └── blog_posts_post2_chunk_1.txt
+        ├── docs_guide.txt.jsonl
+        ├── docs_specs_technical.md.jsonl
+        ├── blog_posts_post1.mdx.jsonl
+        └── blog_posts_post2.md.jsonl
 
 Output Format:
 -------------
-- Creates separate files for each chunk
-- Naming convention: directory_structure_filename_chunk_N.txt
-- For markdown/MDX files, includes metadata section with header context
+- Creates one JSON Lines file per source file, one chunk per line
+- Naming convention: directory_structure_filename.ext.jsonl (the source extension is kept so
+  notes.txt and notes.md in one folder do not overwrite each other)
+- Each line holds {"idx": N, "metadata": {...}, "content": "..."}
+- For markdown/MDX files, metadata carries the header context
 - Maintains document structure and hierarchy
 
 Requirements:
@@ -62,7 +64,10 @@ Requirements:
 - Python 3.6+
 - Required packages:
   - langchain
-  - nltk
+- Optional packages:
+  - semantic-text-splitter (Rust text splitter, used automatically when installed;
+    much faster than the pure-Python splitter and releases the GIL)
+  - orjson (faster JSON serialization of the output files, used when installed)
 
 Notes:
 ------
@@ -70,6 +75,8 @@ Notes:
 - Overlap helps maintain context between chunks
 - Markdown headers are preserved in metadata
 - Script creates output directory if it doesn't exist
+- Chunks are cached in <output>/.chunk_cache by file content, type, chunk size and
+  overlap, so re-runs skip unchanged files; delete that folder to force re-chunking
 - Handles Unicode text encoding
 
 Author: Shiverme Timbers - reddit.com/u/sushibait - sushibait@okbuddy.lol
@@ -80,28 +87,203 @@ License: MIT - Do what you want.
 
 import os
 import re
-from typing import List, Dict
+import stat
+import json
+import pickle
+import hashlib
+from collections import deque
+from typing import List, Dict, Iterable, Iterator, Optional
 import argparse
-from pathlib import Path
-import nltk
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from langchain.text_splitter import (
     RecursiveCharacterTextSplitter,
     MarkdownHeaderTextSplitter
 )
 
-# Download required NLTK data
-nltk.download('punkt', quiet=True)
+# Private langchain helper used by LengthCachingTextSplitter; older langchain releases do not
+# have it, in which case the stock RecursiveCharacterTextSplitter is used instead
+try:
+    from langchain_text_splitters.character import _split_text_with_regex
+except ImportError:
+    _split_text_with_regex = None
+
+try:
+    from semantic_text_splitter import TextSplitter as _RustTextSplitter
+except ImportError:
+    _RustTextSplitter = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Part of the chunk cache key, since the two backends pick different chunk boundaries
+SPLITTER_BACKEND = 'semantic-text-splitter' if _RustTextSplitter is not None else 'langchain'
+
+if orjson is not None:
+    def _dumps_line(record) -> bytes:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    def _dumps_line(record) -> bytes:
+        # Compact separators so the output is byte-identical to orjson's
+        return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+SUPPORTED_EXTENSIONS = ('.txt', '.md', '.mdx')
+
+def _iter_files(path):
+    """Yield (name, path) for every supported regular file under path.
+
+    Symlinked files are followed and dangling ones skipped; symlinked directories are not
+    entered. path itself must not be a symlink (fwalk would not walk it), so resolve it first.
+    """
+    if hasattr(os, 'fwalk'):
+        # fwalk keeps a directory fd open per level and lists entries relative to it,
+        # saving a full path lookup per directory on deep trees (POSIX only)
+        for dirpath, _dirnames, filenames, dirfd in os.fwalk(path, follow_symlinks=False):
+            for name in filenames:
+                if not name.lower().endswith(SUPPORTED_EXTENSIONS):
+                    continue
+                # fwalk also lists dangling symlinks and special files; keep what is_file() would
+                try:
+                    if not stat.S_ISREG(os.stat(name, dir_fd=dirfd).st_mode):
+                        continue
+                except OSError:
+                    continue
+                yield name, os.path.join(dirpath, name)
+    else:
+        yield from _scandir_recursive(path)
+
+def _scandir_recursive(path):
+    """os.scandir fallback for _iter_files on platforms without os.fwalk (e.g. Windows)."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.name.lower().endswith(SUPPORTED_EXTENSIONS) and entry.is_file():
+                yield entry.name, entry.path
+
+class LengthCachingTextSplitter(RecursiveCharacterTextSplitter):
+    """RecursiveCharacterTextSplitter that measures each split only once.
+
+    The stock splitter calls the length function on every split in _split_text, again in
+    _merge_splits, and once more while sliding the overlap window. Here the lengths are
+    computed once and passed along with the splits. Output is identical, except that the
+    upstream "Created a chunk of size X, which is longer than the specified Y" log warning is
+    not emitted.
+    """
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        final_chunks = []
+        # Get appropriate separator to use
+        separator = separators[-1]
+        new_separators = []
+        for i, _s in enumerate(separators):
+            _separator = _s if self._is_separator_regex else re.escape(_s)
+            if _s == "":
+                separator = _s
+                break
+            if re.search(_separator, text):
+                separator = _s
+                new_separators = separators[i + 1:]
+                break
+
+        _separator = separator if self._is_separator_regex else re.escape(separator)
+        splits = _split_text_with_regex(text, _separator, keep_separator=self._keep_separator)
+
+        # Merge the short splits, recursively splitting the long ones
+        good_splits = []
+        good_lengths = []
+        merge_separator = "" if self._keep_separator else separator
+        for s in splits:
+            length = self._length_function(s)
+            if length < self._chunk_size:
+                good_splits.append(s)
+                good_lengths.append(length)
+            else:
+                if good_splits:
+                    final_chunks.extend(self._merge_splits(good_splits, merge_separator, good_lengths))
+                    good_splits = []
+                    good_lengths = []
+                if not new_separators:
+                    final_chunks.append(s)
+                else:
+                    final_chunks.extend(self._split_text(s, new_separators))
+        if good_splits:
+            final_chunks.extend(self._merge_splits(good_splits, merge_separator, good_lengths))
+        return final_chunks
+
+    def _merge_splits(self, splits, separator: str, lengths: Optional[List[int]] = None) -> List[str]:
+        if lengths is None:
+            lengths = [self._length_function(s) for s in splits]
+        separator_len = self._length_function(separator)
+
+        docs = []
+        current_doc = deque()
+        current_lengths = deque()
+        total = 0
+        for d, _len in zip(splits, lengths):
+            if total + _len + (separator_len if current_doc else 0) > self._chunk_size:
+                if current_doc:
+                    doc = self._join_docs(list(current_doc), separator)
+                    if doc is not None:
+                        docs.append(doc)
+                    # Drop splits from the front until only the overlap is left
+                    while total > self._chunk_overlap or (
+                        total + _len + (separator_len if current_doc else 0) > self._chunk_size
+                        and total > 0
+                    ):
+                        total -= current_lengths.popleft() + (separator_len if len(current_doc) > 1 else 0)
+                        current_doc.popleft()
+            current_doc.append(d)
+            current_lengths.append(_len)
+            total += _len + (separator_len if len(current_doc) > 1 else 0)
+        doc = self._join_docs(list(current_doc), separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
+class RustTextSplitter:
+    """Gives semantic-text-splitter's TextSplitter the split_text() interface used by DocumentChunker."""
+
+    def __init__(self, chunk_size: int, chunk_overlap: int):
+        self._splitter = _RustTextSplitter(chunk_size, overlap=chunk_overlap)
+
+    def split_text(self, text: str) -> List[str]:
+        return self._splitter.chunks(text)
+
+# Splitters keep no state between split_text() calls, so instances with the
+# same configuration are shared instead of being rebuilt per DocumentChunker.
+_splitter_cache = {}
+
+def _get_text_splitter(chunk_size, chunk_overlap):
+    key = ('text', chunk_size, chunk_overlap)
+    if key not in _splitter_cache:
+        if _RustTextSplitter is not None:
+            _splitter_cache[key] = RustTextSplitter(chunk_size, chunk_overlap)
+        else:
+            splitter_class = (
+                LengthCachingTextSplitter if _split_text_with_regex is not None
+                else RecursiveCharacterTextSplitter
+            )
+            _splitter_cache[key] = splitter_class(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=["\n\n", "\n", " ", ""]
+            )
+    return _splitter_cache[key]
+
+def _get_md_splitter(md_headers):
+    key = ('markdown', tuple(md_headers))
+    if key not in _splitter_cache:
+        _splitter_cache[key] = MarkdownHeaderTextSplitter(headers_to_split_on=md_headers)
+    return _splitter_cache[key]
 
 class DocumentChunker:
     def __init__(self, chunk_size=500, chunk_overlap=50):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
-        )
+        self.text_splitter = _get_text_splitter(chunk_size, chunk_overlap)
         
         self.md_headers = [
             ("#", "Header 1"),
@@ -109,52 +291,132 @@ class DocumentChunker:
             ("###", "Header 3"),
         ]
         
-        self.md_splitter = MarkdownHeaderTextSplitter(headers_to_split_on=self.md_headers)
+        self.md_splitter = _get_md_splitter(self.md_headers)
 
     def read_file(self, file_path: str) -> str:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        # Unbuffered binary read: skips the BufferedReader/TextIOWrapper setup for whole-file reads.
+        # Newlines are normalized the same way text mode would.
+        with open(file_path, 'rb', buffering=0) as file:
+            text = file.read().decode('utf-8')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
 
-    def process_markdown(self, text: str) -> List[Dict]:
+    def process_markdown(self, text: str) -> Iterator[Dict]:
+        # Chunks are yielded one at a time so each can be written and released immediately
         splits = self.md_splitter.split_text(text)
-        final_chunks = []
         for split in splits:
             if len(split.page_content) > self.chunk_size:
-                smaller_chunks = self.text_splitter.split_text(split.page_content)
-                for chunk in smaller_chunks:
-                    final_chunks.append({
+                for chunk in self._split_oversized(split.page_content):
+                    yield {
                         'content': chunk,
                         'metadata': split.metadata
-                    })
+                    }
             else:
-                final_chunks.append({
+                yield {
                     'content': split.page_content,
                     'metadata': split.metadata
-                })
-        return final_chunks
+                }
 
-    def process_text(self, text: str) -> List[Dict]:
-        chunks = self.text_splitter.split_text(text)
-        return [{'content': chunk, 'metadata': {}} for chunk in chunks]
+    def _split_oversized(self, text: str) -> Iterator[str]:
+        # Guard against pathological input (e.g. one huge unbroken line) blowing the recursion
+        # stack or leaving chunks far above chunk_size: fall back to fixed-size windows.
+        try:
+            chunks = self.text_splitter.split_text(text)
+        except RecursionError:
+            chunks = [text]
 
-    def save_chunks(self, chunks: List[Dict], output_dir: str, original_filename: str):
-        os.makedirs(output_dir, exist_ok=True)
+        limit = self.chunk_size * 2
+        step = self.chunk_size - self.chunk_overlap
+        for chunk in chunks:
+            if len(chunk) > limit:
+                yield from (chunk[i:i + self.chunk_size] for i in range(0, len(chunk), step))
+            else:
+                yield chunk
+
+    def process_text(self, text: str) -> Iterator[Dict]:
+        for chunk in self.text_splitter.split_text(text):
+            yield {'content': chunk, 'metadata': {}}
+
+    def save_chunks(self, chunks: Iterable[Dict], output_dir: str, base: str) -> int:
+        # All chunks of a source file go into one JSON Lines file: one open/close per file.
+        # output_dir must already exist; base is the output name without the .jsonl suffix.
+        output_file = os.path.join(output_dir, f"{base}.jsonl")
         
-        for i, chunk in enumerate(chunks):
-            output_file = os.path.join(
-                output_dir, 
-                f"{os.path.splitext(original_filename)[0]}_chunk_{i+1}.txt"
-            )
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if chunk['metadata']:
-                    f.write("--- Metadata ---\n")
-                    for key, value in chunk['metadata'].items():
-                        f.write(f"{key}: {value}\n")
-                    f.write("\n--- Content ---\n")
-                
-                f.write(chunk['content'])
-            print(f"Saved chunk {i+1} to: {output_file}")
+        # Records are serialized straight to UTF-8 bytes, one write per chunk.
+        # chunks may be a generator, so they are counted as they are written. They are written to
+        # a temp file that is renamed on success, so a failure partway never leaves a truncated
+        # output file that looks complete.
+        count = 0
+        tmp_file = f"{output_file}.{os.getpid()}.tmp"
+        # Opened outside the try: if the open itself fails there is nothing to clean up
+        f = open(tmp_file, 'wb')
+        try:
+            with f:
+                for count, chunk in enumerate(chunks, 1):
+                    f.write(_dumps_line({
+                        'idx': count,
+                        'metadata': chunk['metadata'],
+                        'content': chunk['content']
+                    }))
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+        os.replace(tmp_file, output_file)
+        return count
+
+# One chunker per worker process, built once by the pool initializer
+_worker_chunker = None
+
+def _init_worker(chunk_size, chunk_overlap):
+    global _worker_chunker
+    _worker_chunker = DocumentChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+# Cache files hold one pickle per chunk so they can be written and read back as streams
+def _load_cached_chunks(cache_file: str) -> Iterator[Dict]:
+    with open(cache_file, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def _tee_to_cache(chunks: Iterable[Dict], cache) -> Iterator[Dict]:
+    for chunk in chunks:
+        pickle.dump(chunk, cache, protocol=pickle.HIGHEST_PROTOCOL)
+        yield chunk
+
+def process_one(file_path: str, output_dir: str, base: str, cache_dir: str, is_markdown: bool) -> int:
+    """Read, chunk and save a single file inside a worker process. Returns the chunk count."""
+    text = _worker_chunker.read_file(file_path)
+
+    # Chunking is deterministic in (content, file type, chunk size, overlap), so unchanged
+    # files are loaded from the cache instead of being split again
+    content_hash = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    cache_key = (
+        f"{content_hash}_{'md' if is_markdown else 'txt'}_"
+        f"{_worker_chunker.chunk_size}_{_worker_chunker.chunk_overlap}_{SPLITTER_BACKEND}"
+    )
+    cache_file = os.path.join(cache_dir, f"{cache_key}.pkl")
+
+    if os.path.exists(cache_file):
+        return _worker_chunker.save_chunks(_load_cached_chunks(cache_file), output_dir, base)
+
+    if is_markdown:
+        chunks = _worker_chunker.process_markdown(text)
+    else:
+        chunks = _worker_chunker.process_text(text)
+
+    # Fill the cache while the chunks stream to the output file. Write to a temp file and
+    # rename so a crash never leaves a truncated cache entry.
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    cache = open(tmp_file, 'wb')
+    try:
+        with cache:
+            num_chunks = _worker_chunker.save_chunks(_tee_to_cache(chunks, cache), output_dir, base)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+    os.replace(tmp_file, cache_file)
+    return num_chunks
 
 def get_valid_path(prompt, is_input=True):
     while True:
@@ -206,20 +468,35 @@ def main():
     print(f"Input path: {input_path}")
     print(f"Output directory: {output_dir}")
     print(f"Chunk size: {chunk_size}")
-    print(f"Chunk overlap: {chunk_overlap}\n")
-    
-    chunker = DocumentChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    
-    input_path = Path(input_path)
+    print(f"Chunk overlap: {chunk_overlap}")
+    print(f"Splitter: {SPLITTER_BACKEND}\n")
     
-    # Modified file collection with better feedback
+    # Single pass over the tree, filtering on the file name only
     print("\nScanning for files...")
-    files = []
-    for extension in ['.txt', '.md', '.mdx']:
-        found_files = list(input_path.rglob(f'*{extension}'))
-        files.extend(found_files)
+    files_by_ext = {extension: [] for extension in SUPPORTED_EXTENSIONS}
+    if os.path.isfile(input_path):
+        input_root = os.path.dirname(input_path)
+        candidates = [(os.path.basename(input_path), input_path)]
+    else:
+        # Resolve a symlinked input folder; fwalk does not descend into a symlink root
+        input_root = os.path.realpath(input_path)
+        candidates = _iter_files(input_root)
+
+    for name, path in candidates:
+        # Extensions match case-insensitively (README.TXT, Guide.MD), as on Windows
+        name = name.lower()
+        if name.endswith(SUPPORTED_EXTENSIONS):
+            # Bin on the matched suffix; splitext() treats a bare '.md' as having no extension
+            files_by_ext['.' + name.rpartition('.')[2]].append(path)
+
+    for extension, found_files in files_by_ext.items():
         print(f"Found {len(found_files)} {extension} files")
 
+    # File type is known from the scan, so keep text and markdown files in separate lists
+    txt_files = files_by_ext['.txt']
+    md_files = files_by_ext['.md'] + files_by_ext['.mdx']
+    files = txt_files + md_files
+
     if not files:
         print("No .txt, .md, or .mdx files found in the specified path!")
         return
@@ -227,8 +504,7 @@ def main():
     # Group files by directory for better organization
     files_by_dir = {}
     for file in files:
-        rel_path = file.relative_to(input_path)
-        parent = str(rel_path.parent)
+        parent = os.path.dirname(os.path.relpath(file, input_root)) or '.'
         if parent not in files_by_dir:
             files_by_dir[parent] = []
         files_by_dir[parent].append(file)
@@ -243,26 +519,39 @@ def main():
     print("\nStarting processing...")
     
     total_chunks = 0
-    for file_path in files:
-        rel_path = file_path.relative_to(input_path)
-        print(f"\nProcessing: {rel_path}")
-        try:
-            text = chunker.read_file(str(file_path))
-            
-            if file_path.suffix.lower() in ['.md', '.mdx']:
-                chunks = chunker.process_markdown(text)
-            else:
-                chunks = chunker.process_text(text)
-            
-            # Modified output filename to include directory structure
-            output_filename = str(rel_path).replace('/', '_').replace('\\', '_')
-            chunker.save_chunks(chunks, output_dir, output_filename)
-            
-            total_chunks += len(chunks)
-            print(f"✓ Created {len(chunks)} chunks")
-            
-        except Exception as e:
-            print(f"✗ Error processing {rel_path}: {str(e)}")
+    cache_dir = os.path.join(output_dir, '.chunk_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    # Files are independent, so chunk them across all cores
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(chunk_size, chunk_overlap)) as executor:
+        futures = {}
+        used_bases = set()
+        for is_markdown, paths in ((False, txt_files), (True, md_files)):
+            for file_path in paths:
+                rel_path = os.path.relpath(file_path, input_root)
+                # Output name includes the directory structure: docs/specs/technical.md -> docs_specs_technical.md
+                base = rel_path.replace(os.sep, '_')
+                # Flattening can still collide (a/b.txt vs a_b.txt). Two workers must never write
+                # the same output file, so number any repeats (compared case-insensitively for Windows).
+                unique_base = base
+                n = 1
+                while unique_base.lower() in used_bases:
+                    n += 1
+                    unique_base = f"{base}_{n}"
+                if unique_base != base:
+                    print(f"Note: output name for {rel_path} already used, writing {unique_base}.jsonl")
+                used_bases.add(unique_base.lower())
+                base = unique_base
+                future = executor.submit(process_one, file_path, output_dir, base, cache_dir, is_markdown)
+                futures[future] = (rel_path, base)
+        # Progress is only printed here: lines from the workers would interleave
+        for future in as_completed(futures):
+            rel_path, base = futures[future]
+            try:
+                num_chunks = future.result()
+                total_chunks += num_chunks
+                print(f"✓ {rel_path}: created {num_chunks} chunks -> {base}.jsonl")
+            except Exception as e:
+                print(f"✗ Error processing {rel_path}: {str(e)}")
 
     print(f"\nProcessing complete!")
     print(f"Total files processed: {len(files)}")
@@ -1,5 +1,8 @@
+import mmap
+import os
 import re
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
 """
@@ -16,6 +19,9 @@ Key Features:
 - Identifies family relationships, including husband (HUSB), wife (WIFE), and children (CHIL).
 - Formats the extracted data into a list of entities and relations, making it easy to
   represent the genealogical data in a knowledge graph.
+- Optionally returns the same data as columns (dictionaries of parallel lists) via
+  `process_gedcom_file_columns`, which fills the columns while streaming the file instead of
+  keeping a dictionary per record, and feeds straight into columnar tools such as pyarrow or pandas.
 - Handles basic GEDCOM date formats.
 
 Usage:
@@ -29,6 +35,10 @@ Example:
     entities, relations = process_gedcom_file("path/to/your/gedcom_file.ged")
     # Now you can use the 'entities' and 'relations' lists to build your knowledge graph.
 
+    # For very large files, stream statements instead of collecting them:
+    for kind, record in iter_gedcom_records("path/to/your/gedcom_file.ged"):
+        ...  # kind is 'entity' or 'relation'
+
 GEDCOM File Structure:
 GEDCOM files are line-based and use a specific syntax.  Each line starts with a level number,
 followed by a tag that indicates the type of information on that line.  For example:
@@ -53,6 +63,34 @@ License: MIT - Do what you want.
 
 """
 
+# Matches "<level> [@xref@] <tag> [value]" on each line of the raw file bytes.
+# Lines may be indented and may end in LF, CRLF or CR alone (old Mac exports), so a line starts
+# after either '\n' or '\r' and ends before either. Fields are separated by spaces/tabs only so a
+# match never runs past its line end, and the groups exclude the '@' delimiters and surrounding
+# whitespace, so nothing needs stripping.
+_LINE_RE = re.compile(
+    rb'(?:^|(?<=\r))[ \t]*(\d+)(?:[ \t]+@(\S+)@)?[ \t]+(\S+)'
+    rb'(?:[ \t]+(\S(?:[^\r\n]*\S)?))?[ \t]*(?=[\r\n]|\Z)',
+    re.MULTILINE
+)
+
+# Level 0 tags that start a record we keep, mapped to the record type
+_RECORD_TYPES = {b'INDI': 'INDI', b'FAM': 'FAM'}
+
+
+def _decode(raw):
+    """
+    Decodes a raw GEDCOM field to text.
+
+    Args:
+        raw (bytes): A field captured from a GEDCOM line, or None.
+
+    Returns:
+        str: The decoded field, or an empty string if the field was absent.
+    """
+    return raw.decode('utf-8', 'replace') if raw is not None else ''
+
+
 class GedcomParser:
     def __init__(self):
         """
@@ -76,59 +114,150 @@ class GedcomParser:
                 - entities: A list of dictionaries representing individuals.
                 - relations: A list of dictionaries representing family relationships.
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                self.parse_line(line.strip())
+        self._scan_file(file_path)
         return self.format_knowledge()
 
+    def parse_file_columns(self, file_path):
+        """
+        Parses a GEDCOM file and extracts family relationships in columnar form.
+
+        Records are appended to the columns as the file is streamed, so parsed records are not
+        kept in the individuals and families dictionaries.
+
+        Args:
+            file_path (str): The path to the GEDCOM file.
+
+        Returns:
+            tuple: A tuple containing two dictionaries of equal-length lists, as returned by
+                `format_columns`.
+        """
+        return self._build_columns(self._iter_raw_records(file_path))
+
+    def iter_records(self, file_path):
+        """
+        Streams knowledge graph statements from a GEDCOM file without keeping parsed records.
+
+        Each individual or family is converted as soon as the next level 0 line closes it, so
+        memory use stays constant no matter how large the file is.
+
+        Args:
+            file_path (str): The path to the GEDCOM file.
+
+        Yields:
+            tuple: ('entity', dict) for each individual, or ('relation', dict) for each family
+                relationship, in the same format as `format_knowledge`.
+        """
+        for record in self._iter_raw_records(file_path):
+            if record['type'] == 'INDI':
+                yield 'entity', self._format_person(record['id'], record)
+            else:
+                for relation in self._format_family(record):
+                    yield 'relation', relation
+
+    def _scan_file(self, file_path):
+        """
+        Parses every record of a GEDCOM file into the individuals and families dictionaries.
+
+        Args:
+            file_path (str): The path to the GEDCOM file.
+        """
+        for record in self._iter_raw_records(file_path):
+            self._store_record(record)
+
+    def _iter_raw_records(self, file_path):
+        """
+        Yields each parsed INDI or FAM record of a GEDCOM file once it is complete.
+
+        Args:
+            file_path (str): The path to the GEDCOM file.
+
+        Yields:
+            dict: A completed individual or family record.
+        """
+        with open(file_path, 'rb') as file:
+            # mmap cannot map an empty file
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            # Scan the whole mapped file with the regex engine instead of iterating lines in Python
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                for match in _LINE_RE.finditer(buffer):
+                    closed = self._handle_line(match)
+                    if closed:
+                        yield closed
+        if self.current_entity:
+            yield self.current_entity
+            self.current_entity = None
+
     def parse_line(self, line):
         """
         Parses a single GEDCOM line.
 
         Args:
-            line (str): A string representing a single line from the GEDCOM file.
+            line (str or bytes): A single line from the GEDCOM file; the line ending may be included.
+        """
+        if isinstance(line, str):
+            line = line.encode('utf-8')
+        match = _LINE_RE.match(line)
+        if match:
+            self._handle_line(match)
+            # Store records as soon as they start so the last one is kept without a closing line
+            if int(match.group(1)) == 0 and self.current_entity:
+                self._store_record(self.current_entity)
+
+    def _handle_line(self, match):
+        """
+        Applies a matched GEDCOM line to the current record.
+
+        Args:
+            match (re.Match): A `_LINE_RE` match holding level, xref, tag and value.
+
+        Returns:
+            dict: The record closed by this line if it is a level 0 line, otherwise None.
         """
-        parts = line.split(' ', 2)
-        level = int(parts<source_id data="0" title="gedcom-to-knowledge-graph.py" />)
-        if len(parts) < 2:
-            return
+        level = int(match.group(1))
+        xref, tag, value = match.group(2), match.group(3), match.group(4)
 
         # Handle INDI and FAM records
         if level == 0:
-            if 'INDI' in line:
-                id = parts[1].replace('@', '')
-                self.current_entity = {'id': id, 'type': 'INDI'}
-                self.individuals[id] = self.current_entity
-            elif 'FAM' in line:
-                id = parts[1].replace('@', '')
-                self.current_entity = {'id': id, 'type': 'FAM'}
-                self.families[id] = self.current_entity
+            closed = self.current_entity
+            record_type = _RECORD_TYPES.get(tag)
+            if record_type and xref:
+                self.current_entity = {'id': _decode(xref), 'type': record_type}
             else:
                 self.current_entity = None
+            return closed
 
         # Handle individual details
         elif self.current_entity and self.current_entity['type'] == 'INDI':
             if level == 1:
-                self.current_tag = parts[1]
-                if len(parts) > 2:
-                    self.current_entity[self.current_tag] = parts[2]
+                self.current_tag = _decode(tag)
+                if value is not None:
+                    self.current_entity[self.current_tag] = _decode(value)
             elif level == 2 and self.current_tag:
-                if self.current_tag not in self.current_entity:
-                    self.current_entity[self.current_tag] = {}
-                self.current_entity[self.current_tag][parts[1]] = parts[2] if len(parts) > 2 else ''
+                details = self.current_entity.setdefault(self.current_tag, {})
+                # Skip sub-tags of a level 1 tag that already holds a plain value (e.g. NAME/GIVN)
+                if isinstance(details, dict):
+                    details[_decode(tag)] = _decode(value)
 
         # Handle family relationships
         elif self.current_entity and self.current_entity['type'] == 'FAM':
-            if level == 1:
-                tag = parts[1]
-                if len(parts) > 2:
-                    value = parts[2].replace('@', '')
-                    if tag in ['HUSB', 'WIFE']:
-                        self.current_entity[tag] = value
-                    elif tag == 'CHIL':
-                        if 'CHIL' not in self.current_entity:
-                            self.current_entity['CHIL'] = []
-                        self.current_entity['CHIL'].append(value)
+            if level == 1 and value is not None:
+                if tag in (b'HUSB', b'WIFE'):
+                    self.current_entity[_decode(tag)] = _decode(value).replace('@', '')
+                elif tag == b'CHIL':
+                    self.current_entity.setdefault('CHIL', []).append(_decode(value).replace('@', ''))
+
+    def _store_record(self, record):
+        """
+        Stores a parsed record in the individuals or families dictionary.
+
+        Args:
+            record (dict): An individual (INDI) or family (FAM) record.
+        """
+        if record['type'] == 'INDI':
+            self.individuals[record['id']] = record
+        else:
+            self.families[record['id']] = record
 
     def format_knowledge(self):
         """
@@ -139,52 +268,173 @@ class GedcomParser:
                 - entities: A list of dictionaries representing individuals.
                 - relations: A list of dictionaries representing family relationships.
         """
-        entities = []
+        entities = [self._format_person(person_id, person) for person_id, person in self.individuals.items()]
         relations = []
-
-        # Create person entities
-        for person_id, person in self.individuals.items():
-            name = person.get('NAME', f"Unknown_{person_id}")
-            birth_date = self._extract_date(person.get('BIRT', {}))
-            death_date = self._extract_date(person.get('DEAT', {}))
-
-            observations = [
-                f"Name: {name}",
-                f"Birth date: {birth_date}" if birth_date else None,
-                f"Death date: {death_date}" if death_date else None
-            ]
-
-            entities.append({
-                "name": f"Person_{person_id}",
-                "entityType": "Person",
-                "observations": [obs for obs in observations if obs]
-            })
-
-        # Create family relationships
         for family in self.families.values():
-            if 'HUSB' in family and 'WIFE' in family:
-                relations.append({
-                    "from": f"Person_{family['HUSB']}",
-                    "to": f"Person_{family['WIFE']}",
-                    "relationType": "married_to"
-                })
-
-            for child in family.get('CHIL', []):
-                if 'HUSB' in family:
-                    relations.append({
-                        "from": f"Person_{family['HUSB']}",
-                        "to": f"Person_{child}",
-                        "relationType": "parent_of"
-                    })
-                if 'WIFE' in family:
-                    relations.append({
-                        "from": f"Person_{family['WIFE']}",
-                        "to": f"Person_{child}",
-                        "relationType": "parent_of"
-                    })
+            relations.extend(self._format_family(family))
 
         return entities, relations
 
+    def _format_person(self, person_id, person):
+        """
+        Formats an individual record as a knowledge graph entity.
+
+        Args:
+            person_id (str): The individual's GEDCOM id.
+            person (dict): The parsed individual record.
+
+        Returns:
+            dict: The person entity.
+        """
+        name = person.get('NAME', f"Unknown_{person_id}")
+        birth_date = self._extract_date(person.get('BIRT', {}))
+        death_date = self._extract_date(person.get('DEAT', {}))
+
+        observations = [
+            f"Name: {name}",
+            f"Birth date: {birth_date}" if birth_date else None,
+            f"Death date: {death_date}" if death_date else None
+        ]
+
+        return {
+            "name": f"Person_{person_id}",
+            "entityType": "Person",
+            "observations": [obs for obs in observations if obs]
+        }
+
+    def _format_family(self, family):
+        """
+        Formats a family record as knowledge graph relations.
+
+        Args:
+            family (dict): The parsed family record.
+
+        Returns:
+            list: The marriage and parent-child relations of the family.
+        """
+        return [
+            {"from": from_id, "to": to_id, "relationType": relation_type}
+            for from_id, to_id, relation_type in self._iter_family_relations(family)
+        ]
+
+    def _iter_family_relations(self, family):
+        """
+        Yields the marriage and parent-child relations of a family record.
+
+        Both `_format_family` and `format_columns` are built on this, so the relation rules
+        live in one place.
+
+        Args:
+            family (dict): The parsed family record.
+
+        Yields:
+            tuple: (from, to, relationType) for each relation.
+        """
+        if 'HUSB' in family and 'WIFE' in family:
+            yield f"Person_{family['HUSB']}", f"Person_{family['WIFE']}", "married_to"
+
+        for child in family.get('CHIL', []):
+            if 'HUSB' in family:
+                yield f"Person_{family['HUSB']}", f"Person_{child}", "parent_of"
+            if 'WIFE' in family:
+                yield f"Person_{family['WIFE']}", f"Person_{child}", "parent_of"
+
+    def format_columns(self):
+        """
+        Formats the parsed data as columns (one list per field) instead of one dictionary per record.
+
+        Column lists avoid allocating a dictionary for every person and relationship, and can be
+        handed as-is to columnar writers such as `pyarrow.Table.from_pydict` or `pandas.DataFrame`.
+
+        Returns:
+            tuple: A tuple containing two dictionaries of equal-length lists:
+                - entities: Columns 'name', 'person_name', 'birth_date' and 'death_date'.
+                - relations: Columns 'from', 'to' and 'relationType'.
+        """
+        return self._build_columns(chain(self.individuals.values(), self.families.values()))
+
+    def _build_columns(self, records):
+        """
+        Appends parsed records to entity and relation columns.
+
+        A record whose id was already seen replaces the earlier rows in place, so the result
+        matches `format_knowledge`, where the last record stored for an id wins.
+
+        Args:
+            records (iterable): Individual (INDI) and family (FAM) records, in any order.
+
+        Returns:
+            tuple: The entity and relation columns, as described in `format_columns`.
+        """
+        names = []
+        person_names = []
+        birth_dates = []
+        death_dates = []
+        from_ids = []
+        to_ids = []
+        relation_types = []
+
+        # Row of each person, and (start, stop) rows of each family's relations
+        person_rows = {}
+        family_rows = {}
+
+        for record in records:
+            record_id = record['id']
+            if record['type'] == 'INDI':
+                row = (
+                    f"Person_{record_id}",
+                    record.get('NAME', f"Unknown_{record_id}"),
+                    self._extract_date(record.get('BIRT', {})),
+                    self._extract_date(record.get('DEAT', {})),
+                )
+                i = person_rows.get(record_id)
+                if i is None:
+                    person_rows[record_id] = len(names)
+                    names.append(row[0])
+                    person_names.append(row[1])
+                    birth_dates.append(row[2])
+                    death_dates.append(row[3])
+                else:
+                    names[i], person_names[i], birth_dates[i], death_dates[i] = row
+                continue
+
+            rows = list(self._iter_family_relations(record))
+            span = family_rows.get(record_id)
+            if span is None:
+                family_rows[record_id] = (len(from_ids), len(from_ids) + len(rows))
+                for from_id, to_id, relation_type in rows:
+                    from_ids.append(from_id)
+                    to_ids.append(to_id)
+                    relation_types.append(relation_type)
+                continue
+
+            # Repeated family id: swap its old rows for the new ones and shift the families after it
+            start, stop = span
+            from_ids[start:stop] = [row[0] for row in rows]
+            to_ids[start:stop] = [row[1] for row in rows]
+            relation_types[start:stop] = [row[2] for row in rows]
+            family_rows[record_id] = (start, start + len(rows))
+            shift = len(rows) - (stop - start)
+            if shift:
+                after = False
+                for family_id, (first, last) in family_rows.items():
+                    if after:
+                        family_rows[family_id] = (first + shift, last + shift)
+                    after = after or family_id == record_id
+
+        entities = {
+            "name": names,
+            "person_name": person_names,
+            "birth_date": birth_dates,
+            "death_date": death_dates,
+        }
+        relations = {
+            "from": from_ids,
+            "to": to_ids,
+            "relationType": relation_types,
+        }
+        return entities, relations
+
     def _extract_date(self, date_dict):
         """
         Extracts date from GEDCOM date dictionary.
@@ -212,5 +462,45 @@ def process_gedcom_file(file_path):
             - entities: A list of dictionaries representing individuals.
             - relations: A list of dictionaries representing family relationships.
     """
+    # Records are formatted as they stream in, so only the output is kept. It is keyed by id so a
+    # repeated id keeps its last record, like `GedcomParser.parse_file`.
+    parser = GedcomParser()
+    entities = {}
+    relations = {}
+    for record in parser._iter_raw_records(file_path):
+        if record['type'] == 'INDI':
+            entities[record['id']] = parser._format_person(record['id'], record)
+        else:
+            relations[record['id']] = parser._format_family(record)
+    return list(entities.values()), [relation for family in relations.values() for relation in family]
+
+
+def iter_gedcom_records(file_path):
+    """
+    Streams knowledge graph statements from a single GEDCOM file.
+
+    Args:
+        file_path (str): The path to the GEDCOM file.
+
+    Yields:
+        tuple: ('entity', dict) or ('relation', dict), as each record is completed. Nothing is
+            kept between records, so a repeated id is yielded again rather than replaced.
+    """
+    parser = GedcomParser()
+    return parser.iter_records(file_path)
+
+
+def process_gedcom_file_columns(file_path):
+    """
+    Processes a single GEDCOM file and returns knowledge graph data in columnar form.
+
+    Args:
+        file_path (str): The path to the GEDCOM file.
+
+    Returns:
+        tuple: A tuple containing two dictionaries of equal-length lists:
+            - entities: Person columns (see `GedcomParser.format_columns`).
+            - relations: Relationship columns (see `GedcomParser.format_columns`).
+    """
     parser = GedcomParser()
-    return parser.parse_file(file_path)
\ No newline at end of file
+    return parser.parse_file_columns(file_path)
\ No newline at end of file
@@ -23,10 +23,10 @@ How it works:
 1. The script prompts the user for input and output PDF file paths
 2. Validates both paths to ensure they exist
 3. Opens the input PDF using PyMuPDF
-4. Iterates through each page of the PDF
-5. Identifies all images on each page
-6. Removes each image using its reference number
-7. Saves the modified PDF to the specified output location
+4. Finds every image object in one pass over the PDF's cross-reference (xref) table
+5. Counts images shared across pages only once
+6. Replaces each image object with a single shared, fully transparent placeholder
+7. Saves the modified PDF to the specified output location, dropping unused objects
 
 Usage:
 ------
@@ -39,7 +39,7 @@ Notes:
 ------
 - Works with both absolute and relative paths
 - Handles both forward slashes (/) and backslashes (\) in Windows paths
-- Provides feedback about the number of images found on each page
+- Provides feedback about the number of images found in the document
 - Includes error handling for file operations
 
 Example:
@@ -54,6 +54,27 @@ Version: 1.1
 import fitz  # PyMuPDF
 import os
 
+def _find_image_xrefs(pdf_document):
+    """Finds every image object in a PDF with one pass over its cross-reference table.
+
+    Args:
+        pdf_document: An open PyMuPDF document.
+
+    Returns:
+        A tuple of (xref numbers of all image objects, xref numbers of the image objects that
+        are only another image's /SMask soft mask).
+    """
+    image_xrefs = []
+    mask_xrefs = set()
+    for xref in range(1, pdf_document.xref_length()):
+        if pdf_document.xref_get_key(xref, "Subtype")[1] != "/Image":
+            continue
+        image_xrefs.append(xref)
+        key_type, value = pdf_document.xref_get_key(xref, "SMask")
+        if key_type == "xref":
+            mask_xrefs.add(int(value.split()[0]))
+    return image_xrefs, mask_xrefs
+
 def remove_images_from_pdf(input_pdf, output_pdf):
     """Removes images from a PDF file.
 
@@ -67,41 +88,54 @@ def remove_images_from_pdf(input_pdf, output_pdf):
         print(f"Error: Input PDF file '{input_pdf}' not found.")
         return
 
-    for page_num in range(len(pdf_document)):
-        page = pdf_document.load_page(page_num)
-        image_list = page.get_images()
-        print(f"Page {page_num + 1}: {len(image_list)} images found")
-        for img in image_list:
-            page.delete_image(img[7]) 
+    # Images shared across pages are a single object, so each one is found and removed once
+    # Soft masks are image objects too; they are replaced along with their images but not counted
+    image_xrefs, mask_xrefs = _find_image_xrefs(pdf_document)
+    image_count = len(image_xrefs) - len(mask_xrefs.intersection(image_xrefs))
+    print(f"{image_count} images found in {len(pdf_document)} pages")
+
+    if image_xrefs and len(pdf_document):
+        # Same trick as Page.delete_image, but the transparent 1x1 placeholder is inserted
+        # once and copied over every image object instead of being re-inserted per image.
+        page = pdf_document.load_page(0)
+        pix = fitz.Pixmap(fitz.csGRAY, (0, 0, 1, 1), 1)
+        pix.clear_with()
+        placeholder_xref = page.insert_image(page.rect, pixmap=pix)
+        # Blank out the drawing command the insertion added to the page
+        pdf_document.update_stream(page.get_contents()[-1], b" ")
+        for xref in image_xrefs:
+            pdf_document.xref_copy(placeholder_xref, xref)
+    print(f"Removed {image_count} images")
 
     try:
-        pdf_document.save(output_pdf)
+        # garbage=4 drops the orphaned image streams so the file actually shrinks
+        pdf_document.save(output_pdf, garbage=4, deflate=True)
     except Exception as e:
         print(f"Error saving the PDF: {e}")
     finally:
         pdf_document.close()
 
 
-
-# Windows-specific path handling:
-while True:
-    input_path = input("Enter the path to the input PDF: ")
-    # Normalize the path for Windows (handles backslashes and forward slashes)
-    input_path = os.path.normpath(input_path)  
-    if os.path.exists(input_path):
-        break
-    else:
-        print("File not found. Please enter a valid path.")
-
-while True:
-    output_path = input("Enter the path to the output PDF: ")
-    output_path = os.path.normpath(output_path)
-    if os.path.exists(os.path.dirname(output_path)):
-        break
-    else:
-        print("Invalid output path. Please enter a valid path.")
-
-
-# Usage
-remove_images_from_pdf(input_path, output_path)
-print("Image removal complete.")
\ No newline at end of file
+if __name__ == "__main__":
+    # Windows-specific path handling:
+    while True:
+        input_path = input("Enter the path to the input PDF: ")
+        # Normalize the path for Windows (handles backslashes and forward slashes)
+        input_path = os.path.normpath(input_path)  
+        if os.path.exists(input_path):
+            break
+        else:
+            print("File not found. Please enter a valid path.")
+
+    while True:
+        output_path = input("Enter the path to the output PDF: ")
+        output_path = os.path.normpath(output_path)
+        if os.path.exists(os.path.dirname(output_path)):
+            break
+        else:
+            print("Invalid output path. Please enter a valid path.")
+
+
+    # Usage
+    remove_images_from_pdf(input_path, output_path)
+    print("Image removal complete.")
\ No newline at end of file
@@ -0,0 +1,121 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    'gedcom_to_knowledge_graph',
+    Path(__file__).resolve().parent.parent / 'gedcom-to-knowledge-graph.py',
+)
+gedcom = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gedcom)
+
+SAMPLE_LINES = [
+    '0 HEAD',
+    '1 CHAR UTF-8',
+    '0 @I1@ INDI',
+    '1 NAME John /Doe/',
+    '1 BIRT',
+    '2 DATE 1 JAN 1980',
+    '0 @I2@ INDI',
+    '1 NAME Jane /Roe/',
+    '1 DEAT',
+    '2 DATE 2 FEB 2020',
+    '0 @I3@ INDI',
+    '1 NAME Kid /Doe/',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+    '1 WIFE @I2@',
+    '1 CHIL @I3@',
+    '0 TRLR',
+]
+
+EXPECTED_ENTITIES = [
+    {'name': 'Person_I1', 'entityType': 'Person',
+     'observations': ['Name: John /Doe/', 'Birth date: 1 JAN 1980']},
+    {'name': 'Person_I2', 'entityType': 'Person',
+     'observations': ['Name: Jane /Roe/', 'Death date: 2 FEB 2020']},
+    {'name': 'Person_I3', 'entityType': 'Person',
+     'observations': ['Name: Kid /Doe/']},
+]
+
+EXPECTED_RELATIONS = [
+    {'from': 'Person_I1', 'to': 'Person_I2', 'relationType': 'married_to'},
+    {'from': 'Person_I1', 'to': 'Person_I3', 'relationType': 'parent_of'},
+    {'from': 'Person_I2', 'to': 'Person_I3', 'relationType': 'parent_of'},
+]
+
+
+def _indent(line):
+    return '  ' * int(line.split(' ', 1)[0]) + line
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n', '\r'], ids=['lf', 'crlf', 'cr'])
+@pytest.mark.parametrize('indented', [False, True], ids=['flat', 'indented'])
+def test_line_endings_and_indentation(tmp_path, newline, indented):
+    lines = [_indent(line) for line in SAMPLE_LINES] if indented else SAMPLE_LINES
+    path = tmp_path / 'family.ged'
+    path.write_bytes(newline.join(lines).encode('utf-8') + newline.encode('utf-8'))
+
+    assert gedcom.process_gedcom_file(str(path)) == (EXPECTED_ENTITIES, EXPECTED_RELATIONS)
+    assert gedcom.GedcomParser().parse_file(str(path)) == (EXPECTED_ENTITIES, EXPECTED_RELATIONS)
+
+
+def test_parse_line_accepts_str_and_bytes():
+    parser = gedcom.GedcomParser()
+    for line in SAMPLE_LINES:
+        parser.parse_line(line if line.startswith('0') else line.encode('utf-8'))
+    assert parser.format_knowledge() == (EXPECTED_ENTITIES, EXPECTED_RELATIONS)
+
+
+def test_columns_match_records(tmp_path):
+    path = tmp_path / 'family.ged'
+    path.write_text('\n'.join(SAMPLE_LINES), encoding='utf-8')
+
+    entities, relations = gedcom.process_gedcom_file_columns(str(path))
+    assert entities['name'] == [entity['name'] for entity in EXPECTED_ENTITIES]
+    assert list(zip(relations['from'], relations['to'], relations['relationType'])) == [
+        (relation['from'], relation['to'], relation['relationType']) for relation in EXPECTED_RELATIONS
+    ]
+
+
+# I1 and F1 are repeated; as in parse_file, the last record for an id wins but keeps its first position
+DUPLICATE_LINES = SAMPLE_LINES[:-1] + [
+    '0 @I1@ INDI',
+    '1 NAME Johnny /Doe/',
+    '0 @F1@ FAM',
+    '1 HUSB @I1@',
+    '1 CHIL @I3@',
+    '0 @F2@ FAM',
+    '1 HUSB @I3@',
+    '1 WIFE @I2@',
+    '0 TRLR',
+]
+
+
+def test_columns_keep_last_duplicate_record(tmp_path):
+    path = tmp_path / 'family.ged'
+    path.write_text('\n'.join(DUPLICATE_LINES), encoding='utf-8')
+
+    entities, relations = gedcom.GedcomParser().parse_file(str(path))
+    columns = gedcom.process_gedcom_file_columns(str(path))
+    assert columns[0]['person_name'] == ['Johnny /Doe/', 'Jane /Roe/', 'Kid /Doe/']
+    assert columns[0]['name'] == [entity['name'] for entity in entities]
+    assert list(zip(columns[1]['from'], columns[1]['to'], columns[1]['relationType'])) == [
+        (relation['from'], relation['to'], relation['relationType']) for relation in relations
+    ]
+    assert len(relations) == 2
+
+
+def test_process_gedcom_file_keeps_last_duplicate_record(tmp_path):
+    path = tmp_path / 'family.ged'
+    path.write_text('\n'.join(DUPLICATE_LINES), encoding='utf-8')
+
+    entities, relations = gedcom.process_gedcom_file(str(path))
+    assert (entities, relations) == gedcom.GedcomParser().parse_file(str(path))
+    assert [entity['name'] for entity in entities] == ['Person_I1', 'Person_I2', 'Person_I3']
+    assert entities[0]['observations'] == ['Name: Johnny /Doe/']
+    assert relations == [
+        {'from': 'Person_I1', 'to': 'Person_I3', 'relationType': 'parent_of'},
+        {'from': 'Person_I3', 'to': 'Person_I2', 'relationType': 'married_to'},
+    ]